@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Benchmark rolling median/MAD (Hampel) against a naive pandas implementation."""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rpsd.data import rolling_median_mad
+
+
+def naive_median_mad(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-window median and MAD via pandas rolling().median() / rolling().apply()."""
+    s = pd.Series(x)
+    roll = s.rolling(window, center=True, min_periods=1)
+    med = roll.median().to_numpy()
+    mad = roll.apply(lambda v: np.median(np.abs(v - np.median(v))), raw=True).to_numpy()
+    return med, mad
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'n':>9} {'window':>7} {'naive (s)':>10} {'sorted (s)':>11} {'speedup':>8}")
+    for n, window in [(20_000, 101), (20_000, 1001), (100_000, 1001)]:
+        x = 100 + np.cumsum(0.01 * rng.standard_normal(n))
+
+        t0 = time.perf_counter()
+        med_ref, mad_ref = naive_median_mad(x, window)
+        t_naive = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        med, mad = rolling_median_mad(x, window)
+        t_fast = time.perf_counter() - t0
+
+        assert np.allclose(med, med_ref) and np.allclose(mad, mad_ref)
+        print(f"{n:>9} {window:>7} {t_naive:>10.2f} {t_fast:>11.2f} {t_naive / t_fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,9 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from rpsd.denoise_robust import DenoiseConfig, wavelet_denoise, evaluate_guardrails
+from rpsd.denoise_robust import DenoiseConfig, evaluate_guardrails
+from rpsd.plotting import plot_denoise_comparison
+from rpsd.sessions import denoise_sessions, split_sessions
 
 def create_robust_plot():
     """Create a comprehensive plot using the robust denoiser."""
@@ -52,8 +54,10 @@ def create_robust_plot():
     print(f"   FIR Filter: {config.fir_apply}")
     
     # Apply robust denoising
-    print(f"\n🔄 Applying robust denoising...")
-    denoised = wavelet_denoise(prices, config)
+    # Denoise each trading session separately so overnight gaps are not smeared
+    sessions = split_sessions(timestamps, max_gap="30min")
+    print(f"\n🔄 Applying robust denoising to {len(sessions)} sessions...")
+    denoised = denoise_sessions(prices, timestamps, config, n_jobs=-1, bounds=sessions)
     
     # Evaluate results
     print(f"📈 Evaluating denoising quality...")
@@ -114,52 +118,8 @@ def create_robust_plot():
     # Create visualization
     print(f"\n🎨 Creating robust denoising plot...")
     
-    # Sample data for plotting (avoid overcrowding)
-    max_points = 500
-    if len(prices) > max_points:
-        step = len(prices) // max_points
-        plot_indices = np.arange(0, len(prices), step)
-        plot_prices = prices[plot_indices]
-        plot_denoised = denoised[plot_indices]
-        plot_timestamps = timestamps.iloc[plot_indices]
-    else:
-        plot_prices = prices
-        plot_denoised = denoised
-        plot_timestamps = timestamps
-    
-    # Create figure with subplots
-    fig, axes = plt.subplots(2, 1, figsize=(16, 12))
-    # Remove the long main title that was causing overlap
-    
-    # Top panel: Price series
-    ax1 = axes[0]
-    ax1.plot(plot_timestamps, plot_prices, label='Original', 
-             color='#3498db', linewidth=2, alpha=0.9)
-    ax1.plot(plot_timestamps, plot_denoised, label='Denoised', 
-             color='#e74c3c', linewidth=2, alpha=0.9)
-    ax1.set_title('Price Series', fontsize=16, fontweight='bold', 
-                  color='#2c3e50', pad=35)
-    ax1.set_ylabel('Price ($)', fontsize=14, fontweight='bold', color='#2c3e50')
-    ax1.legend(fontsize=12, framealpha=0.9, loc='upper left')
-    ax1.grid(True, alpha=0.2, linestyle='--')
-    ax1.tick_params(axis='both', which='major', labelsize=11)
-    
-    # Bottom panel: Price changes (increments)
-    ax2 = axes[1]
-    original_changes = np.diff(plot_prices)
-    denoised_changes = np.diff(plot_denoised)
-    
-    ax2.plot(plot_timestamps[1:], original_changes, label='Original Changes', 
-             color='#3498db', linewidth=1.5, alpha=0.8)
-    ax2.plot(plot_timestamps[1:], denoised_changes, label='Denoised Changes', 
-             color='#e74c3c', linewidth=1.5, alpha=0.8)
-    ax2.set_title('Price Changes (Increments)', fontsize=16,
-                  color='#2c3e50', pad=35)
-    ax2.set_xlabel('Time', fontsize=14, fontweight='bold', color='#2c3e50')
-    ax2.set_ylabel('Price Change ($)', fontsize=14, fontweight='bold', color='#2c3e50')
-    ax2.legend(fontsize=12, framealpha=0.9, loc='upper left')
-    ax2.grid(True, alpha=0.2, linestyle='--')
-    ax2.tick_params(axis='both', which='major', labelsize=11)
+    # LTTB for prices, per-pixel min/max for increments (keeps spikes visible)
+    fig, (ax1, ax2) = plot_denoise_comparison(timestamps, prices, denoised, dpi=300)
     
     # Add performance summary text with better styling
     summary_text = f"""Performance Summary:
@@ -181,7 +141,7 @@ def create_robust_plot():
     output_path = 'examples/plots/goog_before_after_robust.png'
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    plt.close(fig)
     
     print(f"✅ Plot saved: {output_path}")
     print(f"📊 Shows: Original vs. denoised prices with performance metrics")
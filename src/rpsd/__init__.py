@@ -1,2 +1,2 @@
-__all__ = ["config", "data", "features", "rough_path", "denoise_robust", "evaluation", "utils"]
+__all__ = ["config", "data", "features", "rough_path", "denoise_robust", "evaluation", "utils", "store", "plotting", "sessions"]
 __version__ = "0.2.0"
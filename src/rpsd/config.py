@@ -16,6 +16,7 @@ class DenoiseConfig:
     n_jobs: int = 1
     verbose: bool = False
     clip_z: float | None = 8.0
+    clip_window: int = 101
     standardize: bool = True
     seed: int = 42
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from .config import DenoiseConfig
+
 
 def _parse_time(col: pd.Series) -> pd.Series:
     try:
@@ -35,12 +40,167 @@ def robust_zscore(x: np.ndarray) -> np.ndarray:
     mad = np.median(np.abs(x - med)) + 1e-12
     return (x - med) / (1.4826 * mad)
 
-def preprocess_prices(df: pd.DataFrame, price_col: str, clip_z: float | None, standardize: bool) -> tuple[pd.DataFrame, float, float]:
-    """Preprocess prices with optional standardization."""
+class _SortedBlocks:
+    """Sorted multiset kept as sorted blocks of ~``load`` values.
+
+    add/remove bisect the block maxima and then one block, so element shifting
+    is bounded by the block size rather than the window. Positional access
+    bisects cumulative block offsets, rebuilt at most once per modification.
+    """
+
+    def __init__(self, values: list[float], load: int) -> None:
+        vals = sorted(values)
+        self._load = load
+        self._blocks = [vals[i:i + load] for i in range(0, len(vals), load)]
+        self._maxes = [b[-1] for b in self._blocks]
+        self._len = len(vals)
+        self._starts: list[int] | None = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> float:
+        starts = self._starts
+        if starts is None:
+            starts = self._starts = [0, *accumulate(map(len, self._blocks))]
+        b = bisect_right(starts, i) - 1
+        return self._blocks[b][i - starts[b]]
+
+    def add(self, v: float) -> None:
+        self._starts = None
+        self._len += 1
+        if not self._blocks:
+            self._blocks, self._maxes = [[v]], [v]
+            return
+        b = min(bisect_left(self._maxes, v), len(self._blocks) - 1)
+        blk = self._blocks[b]
+        insort(blk, v)
+        self._maxes[b] = blk[-1]
+        if len(blk) > 2 * self._load:
+            self._blocks[b:b + 1] = [blk[:self._load], blk[self._load:]]
+            self._maxes[b:b + 1] = [blk[self._load - 1], blk[-1]]
+
+    def remove(self, v: float) -> None:
+        self._starts = None
+        self._len -= 1
+        b = bisect_left(self._maxes, v)
+        blk = self._blocks[b]
+        del blk[bisect_left(blk, v)]
+        if blk:
+            self._maxes[b] = blk[-1]
+        else:
+            del self._blocks[b], self._maxes[b]
+
+def _kth_deviation(s: _SortedBlocks, med: float, k: int, guess: int) -> tuple[float, int]:
+    """k-th (0-based) smallest of ``|s - med|`` and the split that selects it.
+
+    Deviations below the median, read right-to-left, and above it, read
+    left-to-right, are two ascending runs; the answer takes some ``i`` from
+    the left run. The search gallops out from ``guess`` until ``i`` is
+    bracketed and then bisects, so a good guess (the previous window's
+    split) needs O(1) lookups and a bad one O(log len(s)).
+    """
+    h = len(s) // 2
+    n_left, n_right = h, len(s) - h
+    lo, hi = max(0, k + 1 - n_right), min(k + 1, n_left)
+    i = min(max(guess, lo), hi)
+    step, last = 1, 0
+    while True:
+        j = k + 1 - i
+        if i < n_left and j > 0 and s[h + j - 1] - med > med - s[h - 1 - i]:
+            lo, move = i + 1, 1
+        elif i > 0 and j < n_right and med - s[h - i] > s[h + j] - med:
+            hi, move = i - 1, -1
+        else:
+            left = med - s[h - i] if i > 0 else -np.inf
+            right = s[h + j - 1] - med if j > 0 else -np.inf
+            return float(max(left, right)), i
+        if last and move != last:
+            step = 0
+        last = move
+        if step:
+            i = min(i + step, hi) if move > 0 else max(i - step, lo)
+            step *= 2
+        else:
+            i = (lo + hi) // 2
+
+def rolling_median_mad(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Centered rolling median and MAD over ``window // 2`` points each side,
+    shrinking the window at the edges.
+
+    The window lives in sorted blocks of O(sqrt(w)) values. Each slide costs an
+    O(log w) search plus O(sqrt(w)) in-block shifting and offset rebuilding
+    (both C-level list operations). Lookups are O(log w); the median needs
+    two and the MAD O(log w) at worst, typically O(1) when warm-started from
+    the previous window.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    if not np.isfinite(x).all():
+        raise ValueError("x must be finite; drop or fill NaN/inf first")
+    half = window // 2
+    vals = x.tolist()
+    med = np.empty(n)
+    mad = np.empty(n)
+    buf = _SortedBlocks(vals[:half], max(64, 4 * math.isqrt(window)))
+    split = 0
+    for t in range(n):
+        if t + half < n:
+            buf.add(vals[t + half])
+        if t - half - 1 >= 0:
+            buf.remove(vals[t - half - 1])
+        m = len(buf)
+        h = m // 2
+        mid = buf[h] if m % 2 else 0.5 * (buf[h - 1] + buf[h])
+        med[t] = mid
+        if m % 2:
+            mad[t], split = _kth_deviation(buf, mid, h, split)
+        else:
+            lower, split = _kth_deviation(buf, mid, h - 1, split)
+            upper, split = _kth_deviation(buf, mid, h, split)
+            mad[t] = 0.5 * (lower + upper)
+    return med, mad
+
+def _rolling_center_scale(x: np.ndarray, window: int, mad_floor: float | None) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling median and robust scale ``1.4826 * max(MAD, mad_floor)``.
+
+    ``mad_floor`` defaults to the smallest nonzero price change (the tick size),
+    so windows of mostly identical prints keep a usable scale instead of ~0.
+    """
+    med, mad = rolling_median_mad(x, window)
+    if mad_floor is None:
+        steps = np.abs(np.diff(x))
+        steps = steps[steps > 0]
+        mad_floor = float(steps.min()) if len(steps) else 0.0
+    return med, 1.4826 * (np.maximum(mad, mad_floor) + 1e-12)
+
+def rolling_robust_zscore(x: np.ndarray, window: int, mad_floor: float | None = None) -> np.ndarray:
+    """Local analogue of ``robust_zscore`` over a centered rolling window."""
+    x = np.asarray(x, dtype=float)
+    med, scale = _rolling_center_scale(x, window, mad_floor)
+    z: np.ndarray = (x - med) / scale
+    return z
+
+def hampel_clip(x: np.ndarray, window: int, clip_z: float, mad_floor: float | None = None) -> np.ndarray:
+    """Clip points with ``|rolling_robust_zscore| > clip_z`` to the edge of the band.
+
+    Outliers are pulled back to ``median +/- clip_z * scale`` rather than
+    removed, so length and the local price level are preserved.
+    """
+    x = np.asarray(x, dtype=float)
+    med, scale = _rolling_center_scale(x, window, mad_floor)
+    z = (x - med) / scale
+    clipped: np.ndarray = np.where(np.abs(z) > clip_z, med + np.sign(z) * clip_z * scale, x)
+    return clipped
+
+def preprocess_prices(df: pd.DataFrame, price_col: str, clip_z: float | None, standardize: bool, clip_window: int = DenoiseConfig.clip_window) -> tuple[pd.DataFrame, float, float]:
+    """Preprocess prices with optional rolling Hampel clipping and standardization."""
     x = df[price_col].to_numpy(dtype=float)
     
-    # Skip outlier clipping for now to avoid length issues
-    # TODO: Implement robust outlier clipping that preserves baseline and length
+    if clip_z is not None and len(x) > 0:
+        x = hampel_clip(x, clip_window, clip_z)
     
     mean, std = (0.0, 1.0)
     if standardize:
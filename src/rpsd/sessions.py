@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed  # type: ignore[import-untyped]
+
+from .denoise_robust import DenoiseConfig, wavelet_denoise
+from .utils import to_epoch_ns
+
+
+def load_session_calendar(path: str | Path, open_col: str = "open", close_col: str = "close") -> pd.DataFrame:
+    """Read an exchange-session calendar CSV with one ``open``/``close`` row per session."""
+    cal = pd.read_csv(path)
+    if open_col not in cal.columns or close_col not in cal.columns:
+        raise ValueError(f"Missing required columns: {open_col}, {close_col}")
+    out = pd.DataFrame({"open": to_epoch_ns(cal[open_col]), "close": to_epoch_ns(cal[close_col])})
+    if (out["close"] < out["open"]).any():
+        raise ValueError("Session close before open")
+    out = out.sort_values("open").reset_index(drop=True)
+    if (out["open"].to_numpy()[1:] <= out["close"].to_numpy()[:-1]).any():
+        raise ValueError("Overlapping sessions in calendar")
+    return out
+
+def split_sessions(
+    timestamps: Any,
+    max_gap: str | pd.Timedelta = "30min",
+    calendar: pd.DataFrame | None = None,
+) -> list[tuple[int, int]]:
+    """Half-open ``(start, end)`` bounds of contiguous sessions in sorted timestamps.
+
+    Without a calendar a new session starts wherever consecutive timestamps are
+    more than ``max_gap`` apart. With a calendar (see ``load_session_calendar``)
+    sessions are the calendar's ``[open, close]`` intervals; runs of points
+    outside every interval form their own segments.
+    """
+    t = to_epoch_ns(timestamps)
+    n = len(t)
+    if n == 0:
+        return []
+    if np.any(np.diff(t) < 0):
+        raise ValueError("Timestamps must be sorted in ascending order")
+    if calendar is None:
+        gap = pd.Timedelta(max_gap).value
+        cuts = np.flatnonzero(np.diff(t) > gap) + 1
+    else:
+        opens = calendar["open"].to_numpy()
+        closes = calendar["close"].to_numpy()
+        k = np.searchsorted(opens, t, side="right") - 1
+        inside = (k >= 0) & (t <= closes[np.maximum(k, 0)])
+        # Session k gets label 2k; points after its open but outside it get 2k+1,
+        # so the gap between two sessions forms a single segment of its own.
+        label = np.where(inside, 2 * k, 2 * k + 1)
+        cuts = np.flatnonzero(np.diff(label)) + 1
+    starts = np.r_[0, cuts]
+    ends = np.r_[cuts, n]
+    return [(int(i), int(j)) for i, j in zip(starts, ends, strict=True)]
+
+def _denoise_segment(x: np.ndarray, cfg: DenoiseConfig, min_length: int) -> np.ndarray:
+    # joblib hands large arguments to workers as read-only memmaps, which
+    # pywt rejects; work on a private writeable copy.
+    x = np.array(x, dtype=float)
+    if len(x) < min_length:
+        return x
+    return wavelet_denoise(x, cfg)
+
+def denoise_sessions(
+    x: np.ndarray,
+    timestamps: Any,
+    cfg: DenoiseConfig,
+    max_gap: str | pd.Timedelta = "30min",
+    calendar: pd.DataFrame | None = None,
+    n_jobs: int = 1,
+    min_length: int = 32,
+    bounds: list[tuple[int, int]] | None = None,
+) -> np.ndarray:
+    """Denoise each session independently and reassemble them in order.
+
+    Keeps the periodized wavelet transform from wrapping one session's close
+    onto the next session's open. Sessions run in a joblib worker pool when
+    ``n_jobs != 1``; sessions shorter than ``min_length`` are passed through.
+    Pass ``bounds`` from an earlier ``split_sessions`` call to skip re-splitting.
+    """
+    x = np.asarray(x, dtype=float)
+    if bounds is None:
+        t = to_epoch_ns(timestamps)
+        if len(t) != len(x):
+            raise ValueError("x and timestamps must have equal length")
+        bounds = split_sessions(t, max_gap=max_gap, calendar=calendar)
+    else:
+        ends = [0, *(j for _, j in bounds)]
+        if any(i != prev or j <= i for (i, j), prev in zip(bounds, ends, strict=False)) or ends[-1] != len(x):
+            raise ValueError("bounds must be contiguous, non-empty and cover [0, len(x))")
+    parts = Parallel(n_jobs=n_jobs)(
+        delayed(_denoise_segment)(x[i:j], cfg, min_length) for i, j in bounds
+    )
+    if not parts:
+        return x.copy()
+    return np.concatenate(parts)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, is_dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .utils import to_epoch_ns
+
+_INDEX = "index.json"
+_TS = "timestamp"
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def _bound_ns(value: Any) -> int | None:
+    if value is None:
+        return None
+    return int(to_epoch_ns([value])[0])
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """One immutable append: a set of equal-length ``.npy`` columns inside a
+    ``symbol=<s>/date=<YYYY-MM-DD>`` partition."""
+
+    symbol: str
+    date: str
+    path: str
+    start: int
+    end: int
+    rows: int
+    columns: tuple[str, ...]
+    report: dict[str, Any] | None = None
+
+
+class OutputStore:
+    """Append-only, memory-mapped store for denoised series and guardrail reports.
+
+    Layout::
+
+        root/index.json
+        root/symbol=GOOG/date=2025-08-18/part-000000/{timestamp,denoised,...}.npy
+
+    Chunk files are written under a temporary name and renamed into place
+    before ``index.json`` is atomically replaced, so readers always see a
+    consistent snapshot while a single writer appends. Reads memory-map the
+    chunk files and return views, so a time-range read touches only the
+    chunks (and pages) that overlap the range.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # --------------------------
+    # Index
+    # --------------------------
+
+    def _load_index(self) -> dict[str, list[dict[str, Any]]]:
+        p = self.root / _INDEX
+        if not p.exists():
+            return {}
+        obj: dict[str, list[dict[str, Any]]] = json.loads(p.read_text())
+        return obj
+
+    def _write_index(self, index: dict[str, list[dict[str, Any]]]) -> None:
+        tmp = self.root / f".{_INDEX}.{uuid.uuid4().hex}.tmp"
+        tmp.write_text(json.dumps(index, indent=2, default=_json_default))
+        os.replace(tmp, self.root / _INDEX)
+
+    def symbols(self) -> list[str]:
+        return sorted(self._load_index())
+
+    def chunks(self, symbol: str, start: Any = None, end: Any = None) -> list[Chunk]:
+        """Chunks of ``symbol`` overlapping ``[start, end)``, in time order."""
+        lo, hi = _bound_ns(start), _bound_ns(end)
+        out = []
+        for e in self._load_index().get(symbol, []):
+            if lo is not None and e["end"] < lo:
+                continue
+            if hi is not None and e["start"] >= hi:
+                continue
+            out.append(Chunk(symbol=symbol, **{**e, "columns": tuple(e["columns"])}))
+        return out
+
+    # --------------------------
+    # Write
+    # --------------------------
+
+    def append(
+        self,
+        symbol: str,
+        timestamps: Any,
+        denoised: np.ndarray,
+        original: np.ndarray | None = None,
+        report: Any = None,
+    ) -> list[Chunk]:
+        """Append a time-ordered batch for ``symbol``, split into one chunk per UTC date.
+
+        ``report`` (e.g. a ``DenoiseReport``) is stored alongside every chunk of
+        the batch. Batches must not start before the last stored timestamp.
+        """
+        if "/" in symbol or symbol in ("", ".", ".."):
+            raise ValueError(f"Invalid symbol: {symbol!r}")
+        ts = to_epoch_ns(timestamps)
+        cols: dict[str, np.ndarray] = {"denoised": np.asarray(denoised, dtype=float)}
+        if original is not None:
+            cols["original"] = np.asarray(original, dtype=float)
+        if len(ts) == 0:
+            return []
+        for name, arr in cols.items():
+            if arr.ndim != 1 or len(arr) != len(ts):
+                raise ValueError(f"Column {name!r} must be 1-D with {len(ts)} rows")
+        if np.any(np.diff(ts) < 0):
+            raise ValueError("Timestamps must be sorted in ascending order")
+
+        rep = asdict(report) if is_dataclass(report) and not isinstance(report, type) else report
+        # Normalize numpy scalars now so returned chunks match what chunks() reads back
+        rep = json.loads(json.dumps(rep, default=_json_default))
+        index = self._load_index()
+        entries = index.setdefault(symbol, [])
+        columns = [_TS, *cols]
+        if entries:
+            if entries[-1]["columns"] != columns:
+                raise ValueError(f"Columns {columns} do not match stored {entries[-1]['columns']}")
+            if ts[0] < entries[-1]["end"]:
+                raise ValueError("Store is append-only: batch starts before the last stored timestamp")
+
+        days = ts // _NS_PER_DAY
+        cuts = np.flatnonzero(np.diff(days)) + 1
+        bounds = zip(np.r_[0, cuts], np.r_[cuts, len(ts)], strict=True)
+        new: list[Chunk] = []
+        for i, j in bounds:
+            date = str(np.datetime64(int(days[i]), "D"))
+            part = self.root / f"symbol={symbol}" / f"date={date}"
+            part.mkdir(parents=True, exist_ok=True)
+            seq = sum(1 for _ in part.glob("part-*"))
+            tmp = part / f".tmp-{uuid.uuid4().hex}"
+            tmp.mkdir()
+            np.save(tmp / f"{_TS}.npy", ts[i:j])
+            for name, arr in cols.items():
+                np.save(tmp / f"{name}.npy", arr[i:j])
+            final = part / f"part-{seq:06d}"
+            os.replace(tmp, final)
+            entry: dict[str, Any] = {
+                "date": date,
+                "path": final.relative_to(self.root).as_posix(),
+                "start": int(ts[i]),
+                "end": int(ts[j - 1]),
+                "rows": int(j - i),
+                "columns": columns,
+                "report": rep,
+            }
+            entries.append(entry)
+            new.append(Chunk(symbol=symbol, **{**entry, "columns": tuple(columns)}))
+        self._write_index(index)
+        return new
+
+    # --------------------------
+    # Read
+    # --------------------------
+
+    def iter_range(
+        self, symbol: str, start: Any = None, end: Any = None
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """Yield zero-copy column views of ``symbol`` within ``[start, end)``, one per chunk.
+
+        ``timestamp`` is returned as ``datetime64[ns]`` (UTC), other columns as float64.
+        """
+        lo, hi = _bound_ns(start), _bound_ns(end)
+        for c in self.chunks(symbol, start, end):
+            d = self.root / c.path
+            ts = np.load(d / f"{_TS}.npy", mmap_mode="r")
+            i = 0 if lo is None else int(np.searchsorted(ts, lo, side="left"))
+            j = c.rows if hi is None else int(np.searchsorted(ts, hi, side="left"))
+            if j <= i:
+                continue
+            out = {_TS: ts[i:j].view("datetime64[ns]")}
+            for name in c.columns[1:]:
+                out[name] = np.load(d / f"{name}.npy", mmap_mode="r")[i:j]
+            yield out
+
+    def read_range(self, symbol: str, start: Any = None, end: Any = None) -> pd.DataFrame:
+        """Materialize ``[start, end)`` of ``symbol`` as a DataFrame (copies only the range)."""
+        parts = list(self.iter_range(symbol, start, end))
+        if not parts:
+            stored = self.chunks(symbol)
+            columns = stored[-1].columns[1:] if stored else ()
+            empty = {_TS: np.array([], dtype="datetime64[ns]")}
+            return pd.DataFrame({**empty, **{name: np.array([], dtype=float) for name in columns}})
+        return pd.DataFrame({name: np.concatenate([p[name] for p in parts]) for name in parts[0]})
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 import pandas as pd
 
@@ -7,3 +9,12 @@ import pandas as pd
 def to_series(time: pd.Series, values: np.ndarray, name: str) -> pd.Series:
     s = pd.Series(values, index=time, name=name)
     return s
+
+def to_epoch_ns(timestamps: Any) -> np.ndarray:
+    """Timestamps as int64 nanoseconds since the epoch (UTC; naive is taken as UTC)."""
+    t = pd.DatetimeIndex(pd.to_datetime(timestamps))
+    if t.tz is not None:
+        t = t.tz_convert("UTC").tz_localize(None)
+    if t.hasnans:
+        raise ValueError("Timestamps must not contain NaT")
+    return t.as_unit("ns").to_numpy().view(np.int64)
@@ -1,7 +1,8 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 import pytest
-from rpsd.data import read_ticks, preprocess_prices
+from rpsd.data import hampel_clip, preprocess_prices, read_ticks, rolling_median_mad, rolling_robust_zscore
 
 def test_read_ticks_ok(tmp_path):
     p = tmp_path / "ok.csv"
@@ -31,3 +32,40 @@ def test_preprocess_standardize(toy_prices: pd.DataFrame):
     df, mean, std = preprocess_prices(toy_prices, "price", clip_z=8.0, standardize=True)
     assert abs(df["price"].mean()) < 1e-6
     assert std > 0.0
+
+def test_rolling_median_mad_matches_pandas():
+    x = np.random.default_rng(0).standard_normal(500)
+    med, mad = rolling_median_mad(x, 31)
+    roll = pd.Series(x).rolling(31, center=True, min_periods=1)
+    assert np.allclose(med, roll.median())
+    assert np.allclose(mad, roll.apply(lambda v: np.median(np.abs(v - np.median(v))), raw=True))
+
+def test_preprocess_clips_bad_print(toy_prices: pd.DataFrame):
+    df = toy_prices.copy()
+    df.loc[500, "price"] = 1000.0
+    out, _, _ = preprocess_prices(df, "price", clip_z=8.0, standardize=False)
+    assert len(out) == len(df)
+    assert out["price"].iloc[500] < 101.0
+    assert np.allclose(out["price"].drop(index=500), df["price"].drop(index=500))
+
+def test_hampel_clips_bad_print_in_flat_window():
+    z = np.full(1000, 100.0)
+    z[::7] = 100.01
+    z[500] = 1000.0
+    out = hampel_clip(z, 101, 8.0)
+    assert out[500] < 100.5
+    assert np.array_equal(np.delete(out, 500), np.delete(z, 500))
+
+def test_rolling_median_mad_rejects_nan():
+    x = np.r_[np.arange(20.0), np.nan, np.arange(20.0, 60.0)]
+    with pytest.raises(ValueError):
+        rolling_median_mad(x, 5)
+
+def test_rolling_robust_zscore_agrees_with_hampel_clip():
+    z = np.full(1000, 100.0)
+    z[::7] = 100.01
+    z[500] = 1000.0
+    score = rolling_robust_zscore(z, 101)
+    assert abs(score[7]) < 1.0  # one-tick move in a flat window stays small
+    changed = hampel_clip(z, 101, 8.0) != z
+    assert np.array_equal(changed, np.abs(score) > 8.0)
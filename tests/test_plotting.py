@@ -0,0 +1,39 @@
+from __future__ import annotations
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+from rpsd.plotting import lttb_indices, minmax_indices, plot_denoise_comparison
+
+def test_lttb_keeps_endpoints_and_spike():
+    y = np.cumsum(np.random.default_rng(0).standard_normal(100_000))
+    y[31_337] += 1e3
+    idx = lttb_indices(y, 500)
+    assert len(idx) == 500
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 31_337 in idx
+
+def test_minmax_preserves_bucket_extremes():
+    y = np.random.default_rng(1).standard_normal(10_001)
+    idx = minmax_indices(y, 100)
+    assert len(idx) <= 2 * 100 + 2
+    assert y.argmin() in idx and y.argmax() in idx
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+
+def test_lttb_uses_x_spacing():
+    # Two sessions separated by a long gap: with real spacing the point next to
+    # the gap forms a much larger triangle than in index space.
+    t = np.r_[np.arange(500.0), 1e6 + np.arange(500.0)]
+    y = np.sin(np.arange(1000) / 20.0)
+    assert not np.array_equal(lttb_indices(y, 50, x=t), lttb_indices(y, 50))
+    assert np.all(np.diff(lttb_indices(y, 50, x=t)) > 0)
+
+def test_plot_denoise_comparison_smoke():
+    n = 5000
+    t = pd.date_range("2024-01-01", periods=n, freq="min", tz="UTC")
+    x = 100 + np.cumsum(np.random.default_rng(2).normal(0, 0.1, n))
+    fig, (ax1, ax2) = plot_denoise_comparison(t, x, x * 0.99, figsize=(4, 3), dpi=50)
+    assert len(ax1.lines) == 2 and len(ax2.lines) == 2
+    assert len(ax2.lines[0].get_xdata()) <= 2 * 4 * 50 + 2
+    fig.clf()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+import pytest
+from rpsd.denoise_robust import DenoiseConfig, wavelet_denoise
+from rpsd.sessions import denoise_sessions, load_session_calendar, split_sessions
+
+def _two_days() -> pd.DatetimeIndex:
+    d1 = pd.date_range("2024-01-02 14:30", periods=390, freq="min", tz="UTC")
+    d2 = pd.date_range("2024-01-03 14:30", periods=390, freq="min", tz="UTC")
+    return d1.append(d2)
+
+def test_split_sessions_on_gap():
+    t = _two_days()
+    assert split_sessions(t, max_gap="30min") == [(0, 390), (390, 780)]
+    assert split_sessions(t, max_gap="30h") == [(0, 780)]
+
+def test_split_sessions_with_calendar(tmp_path):
+    p = tmp_path / "cal.csv"
+    pd.DataFrame({
+        "open": ["2024-01-02 14:30+00:00", "2024-01-03 14:30+00:00"],
+        "close": ["2024-01-02 17:00+00:00", "2024-01-03 21:00+00:00"],
+    }).to_csv(p, index=False)
+    cal = load_session_calendar(p)
+    # Day one after 17:00 falls outside its session and becomes its own segment
+    assert split_sessions(_two_days(), calendar=cal) == [(0, 151), (151, 390), (390, 780)]
+
+def test_denoise_sessions_matches_per_session():
+    t = _two_days()
+    rng = np.random.default_rng(0)
+    x = np.r_[100 + np.cumsum(0.05 * rng.standard_normal(390)), 110 + np.cumsum(0.05 * rng.standard_normal(390))]
+    cfg = DenoiseConfig()
+    y = denoise_sessions(x, t, cfg, n_jobs=2)
+    assert len(y) == len(x)
+    assert np.allclose(y[:390], wavelet_denoise(x[:390], cfg))
+    assert np.allclose(y[390:], wavelet_denoise(x[390:], cfg))
+
+def test_denoise_sessions_parallel_large_sessions():
+    # Sessions over joblib's 1 MB threshold reach workers as read-only memmaps
+    n = 200_000
+    d1 = pd.date_range("2024-01-01", periods=n, freq="s", tz="UTC")
+    t = d1.append(pd.date_range("2024-01-05", periods=n, freq="s", tz="UTC"))
+    x = 100 + np.cumsum(0.01 * np.random.default_rng(0).standard_normal(2 * n))
+    y = denoise_sessions(x, t, DenoiseConfig(), n_jobs=2)
+    assert len(y) == 2 * n
+    assert np.all(np.isfinite(y))
+
+def test_denoise_sessions_rejects_mismatched_inputs():
+    cfg = DenoiseConfig()
+    with pytest.raises(ValueError):
+        denoise_sessions(np.arange(50.0), [], cfg)
+    t = _two_days()
+    with pytest.raises(ValueError):
+        denoise_sessions(np.arange(700.0), t, cfg)
+    x = np.arange(780.0)
+    for bounds in ([(0, 390)], [(0, 390), (391, 780)], [(0, 390), (390, 390), (390, 780)]):
+        with pytest.raises(ValueError):
+            denoise_sessions(x, t, cfg, bounds=bounds)
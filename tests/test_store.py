@@ -0,0 +1,66 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+import pytest
+from rpsd.denoise_robust import DenoiseReport
+from rpsd.store import OutputStore
+
+def _batch(start: str, n: int, freq: str = "1h") -> tuple[pd.DatetimeIndex, np.ndarray]:
+    t = pd.date_range(start, periods=n, freq=freq, tz="UTC")
+    return t, np.arange(n, dtype=float)
+
+def test_append_partitions_by_date_and_reads_range(tmp_path):
+    store = OutputStore(tmp_path)
+    t, y = _batch("2024-01-01 20:00", 10)
+    rep = DenoiseReport(np.float64(0.99), 0.1, 0.95, 0.98, 0.2, np.True_, {})
+    chunks = store.append("GOOG", t, y, original=y + 1, report=rep)
+    assert [c.date for c in chunks] == ["2024-01-01", "2024-01-02"]
+    assert chunks[0].report["corr"] == 0.99
+    assert chunks == store.chunks("GOOG")
+    assert type(chunks[0].report["corr"]) is float and type(chunks[0].report["passes"]) is bool
+    out = store.read_range("GOOG", "2024-01-01 22:00", "2024-01-02 02:00")
+    assert out["denoised"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert (out["original"] - out["denoised"] == 1.0).all()
+
+def test_iter_range_is_zero_copy(tmp_path):
+    store = OutputStore(tmp_path)
+    t, y = _batch("2024-01-01", 24)
+    store.append("GOOG", t, y)
+    (part,) = store.iter_range("GOOG", "2024-01-01 05:00", "2024-01-01 08:00")
+    assert isinstance(part["denoised"], np.memmap)
+    assert not part["denoised"].flags.writeable
+    assert part["timestamp"].dtype == np.dtype("datetime64[ns]")
+
+def test_append_only(tmp_path):
+    store = OutputStore(tmp_path)
+    t, y = _batch("2024-01-02", 4)
+    store.append("GOOG", t, y)
+    t2, y2 = _batch("2024-01-01", 4)
+    with pytest.raises(ValueError):
+        store.append("GOOG", t2, y2)
+    t3, y3 = _batch("2024-01-02 04:00", 4)
+    store.append("GOOG", t3, y3)
+    assert len(store.chunks("GOOG")) == 2
+    assert len(OutputStore(tmp_path).read_range("GOOG")) == 8
+
+def test_reader_snapshot_survives_append(tmp_path):
+    writer = OutputStore(tmp_path)
+    t, y = _batch("2024-01-01", 6)
+    writer.append("GOOG", t, y)
+    reader = OutputStore(tmp_path)
+    views = list(reader.iter_range("GOOG"))
+    before = [v["denoised"].copy() for v in views]
+    t2, y2 = _batch("2024-01-01 06:00", 6)
+    writer.append("GOOG", t2, y2 + 100)
+    assert all(np.array_equal(v["denoised"], b) for v, b in zip(views, before, strict=True))
+    assert sum(len(v["denoised"]) for v in views) == 6
+    out = OutputStore(tmp_path).read_range("GOOG")
+    assert out["denoised"].tolist() == [*y.tolist(), *(y2 + 100).tolist()]
+
+def test_empty_range_keeps_schema(tmp_path):
+    store = OutputStore(tmp_path)
+    t, y = _batch("2024-01-01", 4)
+    store.append("GOOG", t, y, original=y)
+    out = store.read_range("GOOG", "2025-01-01", "2025-01-02")
+    assert out.empty
+    assert list(out.columns) == ["timestamp", "denoised", "original"]